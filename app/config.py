@@ -0,0 +1,19 @@
+import os
+from dotenv import load_dotenv
+
+# Parse .env once per process; everything else imports the constants below
+load_dotenv()
+
+# Support both MONGO_URI (local) and MONGODB_URI (Vercel/Atlas default)
+MONGO_URI = os.getenv("MONGO_URI") or os.getenv("MONGODB_URI")
+DB_NAME = os.getenv("DB_NAME", "JournalX")
+
+# Legacy PostgreSQL credentials, only used by the trade_no migration scripts
+DB_USER = os.getenv("DB_USER")
+DB_PASSWORD = os.getenv("DB_PASSWORD")
+DB_HOST = os.getenv("DB_HOST")
+
+# Third-party API keys
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+SENDGRID_API_KEY = os.getenv("SENDGRID_API_KEY")
+FINNHUB_API_KEY = os.getenv("FINNHUB_API_KEY")
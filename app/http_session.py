@@ -0,0 +1,30 @@
+from threading import Lock
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# One keep-alive Session per process so repeated calls to the same host
+# reuse the TCP/TLS connection instead of handshaking every time.
+# Pass timeout=DEFAULT_TIMEOUT on each call; requests has no session-wide one.
+DEFAULT_TIMEOUT = 10
+
+_session: requests.Session = None
+_lock = Lock()
+
+def get_session() -> requests.Session:
+    """Return the shared, connection-pooled requests Session (retries transient 5xx)."""
+    global _session
+    with _lock:
+        if _session is None:
+            session = requests.Session()
+            retry = Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[500, 502, 503, 504],
+                raise_on_status=False  # hand back the last 5xx response rather than raising
+            )
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
@@ -167,7 +167,8 @@ async def startup_event():
 def root():
     return {"message": "JournalX Trading API", "version": APP_VERSION}
 
-@app.get("/health")
+# HEAD lets uptime probes check liveness without downloading the body
+@app.api_route("/health", methods=["GET", "HEAD"])
 def health_check():
     db_status = "connected" if db_client.db is not None else "disconnected"
     return {
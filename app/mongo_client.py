@@ -0,0 +1,31 @@
+from threading import Lock
+from typing import Any, Dict, Optional
+from pymongo import MongoClient
+from app.config import MONGO_URI
+
+# One pooled client per URI, shared by every script in the process so the
+# TLS handshake and topology discovery are only paid once.
+_clients: Dict[str, MongoClient] = {}
+_lock = Lock()
+
+def get_client(uri: Optional[str] = None, **kwargs: Any) -> MongoClient:
+    """Return the shared MongoClient for `uri` (defaults to MONGO_URI).
+
+    `kwargs` override the pool defaults, but only when this call creates the
+    client; later calls for the same URI get the cached one unchanged.
+    """
+    uri = uri or MONGO_URI
+    if not uri:
+        raise ValueError("MONGO_URI not set")
+
+    with _lock:
+        client = _clients.get(uri)
+        if client is None:
+            options = {
+                "maxPoolSize": 50,
+                "serverSelectionTimeoutMS": 5000,
+                **kwargs
+            }
+            client = MongoClient(uri, **options)
+            _clients[uri] = client
+        return client
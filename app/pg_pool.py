@@ -0,0 +1,35 @@
+from contextlib import contextmanager
+from threading import Lock
+from psycopg2.pool import ThreadedConnectionPool
+from app.config import DB_HOST, DB_NAME, DB_USER, DB_PASSWORD
+
+# Built on first use so importing this module never opens a connection
+_pool: ThreadedConnectionPool = None
+_lock = Lock()
+
+def get_pg_pool() -> ThreadedConnectionPool:
+    """Return the process-wide PostgreSQL connection pool."""
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ThreadedConnectionPool(
+                1, 10,
+                host=DB_HOST,
+                database=DB_NAME,
+                user=DB_USER,
+                password=DB_PASSWORD
+            )
+        return _pool
+
+@contextmanager
+def pg_connection():
+    """Borrow a pooled connection, roll back on error and always hand it back."""
+    pool = get_pg_pool()
+    conn = pool.getconn()
+    try:
+        yield conn
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        pool.putconn(conn)
@@ -1,7 +1,9 @@
 import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
+from pymongo import InsertOne, UpdateOne
 from pymongo.database import Database
+from pymongo.errors import BulkWriteError
 try:
     from apscheduler.schedulers.asyncio import AsyncIOScheduler
     HAS_SCHEDULER = True
@@ -45,52 +47,67 @@ class EconomicCalendarService:
 
         print(f"DEBUG: Syncing {len(events)} events to DB...")
         
+        # One lookup for every event already stored, then one write per unique_id
+        unique_ids = list({event["unique_id"] for event in events if event.get("unique_id")})
+        existing_by_id = {
+            doc["unique_id"]: doc
+            for doc in db.economic_events.find(
+                {"unique_id": {"$in": unique_ids}},
+                {"unique_id": 1, "actual": 1, "forecast": 1, "previous": 1, "status": 1}
+            )
+        }
+        new_events = {}
+        pending_updates = {}
+        
         for event in events:
             try:
-                # print(f"Processing event: {event.get('unique_id')}")
-                # Check if event exists
-                existing = db.economic_events.find_one({"unique_id": event["unique_id"]})
+                unique_id = event["unique_id"]
+                # A repeat of an event created earlier in this batch is compared against that copy
+                existing = existing_by_id.get(unique_id) or new_events.get(unique_id)
                 
                 if existing:
-                    print(f"DEBUG: Found existing for {event['unique_id']}: {existing.get('_id')} - {existing.get('event_name')}")
                     # Update if actual/forecast/previous changed
                     update_fields = {}
                     
-                    if event.get("actual") != existing.get("actual"):
-                        update_fields["actual"] = event.get("actual")
-                    
-                    if event.get("forecast") != existing.get("forecast"):
-                        update_fields["forecast"] = event.get("forecast")
-                    
-                    if event.get("previous") != existing.get("previous"):
-                        update_fields["previous"] = event.get("previous")
-                    
-                    if event.get("status") != existing.get("status"):
-                        update_fields["status"] = event.get("status")
+                    for field in ("actual", "forecast", "previous", "status"):
+                        if event.get(field) != existing.get(field):
+                            update_fields[field] = event.get(field)
                     
                     if update_fields:
                         update_fields["updated_at"] = datetime.utcnow()
                         update_fields["fetched_at"] = event.get("fetched_at")
                         
-                        db.economic_events.update_one(
-                            {"unique_id": event["unique_id"]},
-                            {"$set": update_fields}
-                        )
+                        # Later events in the batch compare against the new values; a still
+                        # unsent insert already carries them
+                        existing.update(update_fields)
+                        if unique_id not in new_events:
+                            pending_updates.setdefault(unique_id, {}).update(update_fields)
                         updated += 1
                     else:
                         skipped += 1
                 else:
                     # Create new event
                     event["created_at"] = datetime.utcnow()
-                    event["updated_at"] = datetime.utcnow()
+                    event["updated_at"] = event["created_at"]
                     
-                    db.economic_events.insert_one(event)
+                    new_events[unique_id] = event
                     created += 1
                     
             except Exception as e:
                 logger.error(f"Error syncing event {event.get('unique_id')}: {e}")
                 continue
         
+        ops = [InsertOne(event) for event in new_events.values()]
+        ops += [
+            UpdateOne({"unique_id": unique_id}, {"$set": fields})
+            for unique_id, fields in pending_updates.items()
+        ]
+        if ops:
+            try:
+                db.economic_events.bulk_write(ops, ordered=False)
+            except BulkWriteError as e:
+                logger.error(f"Error syncing events: {e.details.get('writeErrors', [])[:5]}")
+        
         logger.info(f"Sync complete: {created} created, {updated} updated, {skipped} skipped")
         
         return {
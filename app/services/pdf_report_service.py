@@ -139,14 +139,10 @@ class PDFReportService:
         sizes = [wins, losses]
         colors_list = ['#10b981', '#f43f5e']
         
+        # Donut effect via wedge width instead of overlaying a centre circle
         plt.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90, 
                 colors=colors_list, textprops={'color':"#0f172a", 'weight':'bold'},
-                pctdistance=0.85, explode=(0.05, 0))
-        
-        # Draw circle for donut effect
-        centre_circle = plt.Circle((0,0), 0.70, fc='white')
-        fig = plt.gcf()
-        fig.gca().add_artist(centre_circle)
+                wedgeprops={'width': 0.3, 'edgecolor': 'white'}, pctdistance=0.85)
         
         plt.title('Trade Distribution', color='#0f172a', fontsize=12, fontweight='bold')
         plt.axis('equal')
@@ -1,5 +1,6 @@
 from pymongo.database import Database
 from datetime import datetime
+import numpy as np
 import pandas as pd
 from typing import Dict, Any, List
 
@@ -29,19 +30,22 @@ class PerformanceService:
 
         df = pd.DataFrame(trades)
         
-        # Stats Calculations
+        # Stats Calculations (plain NumPy on the P&L column, no DataFrame slices)
         total_trades = len(df)
-        wins = df[df['net_profit'] > 0]
-        losses = df[df['net_profit'] <= 0]
+        pnl = df['net_profit'].to_numpy(dtype=float)
+        wins_mask = pnl > 0
+        losses_mask = pnl <= 0
+        n_wins = int(wins_mask.sum())
+        n_losses = int(losses_mask.sum())
         
-        win_rate = (len(wins) / total_trades) * 100 if total_trades > 0 else 0
-        total_pl = df['net_profit'].sum()
+        win_rate = (n_wins / total_trades) * 100 if total_trades > 0 else 0
+        total_pl = np.nansum(pnl)
         
-        max_profit = df['net_profit'].max()
-        max_loss = df['net_profit'].min()
+        max_profit = np.nanmax(pnl)
+        max_loss = np.nanmin(pnl)
         
-        avg_win = wins['net_profit'].mean() if not wins.empty else 0
-        avg_loss = losses['net_profit'].mean() if not losses.empty else 0
+        avg_win = pnl[wins_mask].mean() if n_wins else 0.0
+        avg_loss = pnl[losses_mask].mean() if n_losses else 0.0
         
         # Profile Pairs
         symbol_groups = df.groupby('symbol')['net_profit'].sum()
@@ -49,11 +53,10 @@ class PerformanceService:
         least_profitable_pair = symbol_groups.idxmin() if not symbol_groups.empty else "N/A"
         
         # Equity Curve
-        equity = 0
-        equity_curve = []
-        for _, row in df.iterrows():
-            equity += row['net_profit']
-            equity_curve.append({"time": row['close_time'].strftime("%Y-%m-%d %H:%M"), "equity": float(equity)})
+        equity_curve = [
+            {"time": t.strftime("%Y-%m-%d %H:%M"), "equity": float(e)}
+            for t, e in zip(df['close_time'], np.cumsum(pnl))
+        ]
 
         stats = {
             "most_profitable_pair": most_profitable_pair,
@@ -65,8 +68,8 @@ class PerformanceService:
             "avg_loss_loser": float(avg_loss),
             "win_rate": float(win_rate),
             "total_trades": int(total_trades),
-            "winning_trades": int(len(wins)),
-            "losing_trades": int(len(losses)),
+            "winning_trades": n_wins,
+            "losing_trades": n_losses,
             "equity_curve": equity_curve
         }
 
@@ -0,0 +1,33 @@
+import sqlite3
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+# Legacy local SQLite journal, only read by the debug scripts
+DB_PATH = "trading_journal.db"
+SQLALCHEMY_DATABASE_URL = f"sqlite:///./{DB_PATH}"
+
+# Per-connection only (nothing persisted to the tracked .db file): a 64 MiB
+# page cache and 256 MiB of memory-mapped I/O for the ORDER BY ... LIMIT scans
+PRAGMAS = (
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+def _apply_pragmas(dbapi_conn):
+    cursor = dbapi_conn.cursor()
+    for pragma in PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@event.listens_for(engine, "connect")
+def _on_connect(dbapi_conn, connection_record):
+    _apply_pragmas(dbapi_conn)
+
+def connect() -> sqlite3.Connection:
+    """Plain sqlite3 connection with the same PRAGMAs as `engine`."""
+    conn = sqlite3.connect(DB_PATH)
+    _apply_pragmas(conn)
+    return conn
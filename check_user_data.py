@@ -1,37 +1,39 @@
-import os
-from pymongo import MongoClient
-from dotenv import load_dotenv
-
-load_dotenv()
+from concurrent.futures import ThreadPoolExecutor
+from app.config import MONGO_URI, DB_NAME
+from app.mongo_client import get_client
 
 def check_user_data(user_id):
-    uri = os.getenv("MONGO_URI")
-    db_name = os.getenv("DB_NAME", "JournalX")
-    
     print(f"📡 Connecting to Atlas...")
     
     try:
-        client = MongoClient(uri)
-        db = client[db_name]
+        client = get_client(MONGO_URI)
+        db = client[DB_NAME]
+        
+        # The four lookups are independent; run them concurrently so the
+        # script waits for roughly one round-trip instead of four.
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            user_f = pool.submit(db.users.find_one, {"user_id": user_id})
+            trades_f = pool.submit(db.trades.count_documents, {"user_id": user_id})
+            goals_f = pool.submit(db.goals.count_documents, {"user_id": user_id})
+            mt5_f = pool.submit(db.mt5_credentials.find_one, {"user_id": user_id}, {"_id": 1})
         
-        user = db.users.find_one({"user_id": user_id})
+        user = user_f.result()
         if not user:
             print(f"❌ User {user_id} not found in 'users' collection.")
             # List all users to see if IDs are different
-            all_users = list(db.users.find({}, {"user_id": 1, "email": 1}))
-            print(f"👥 Available users ({len(all_users)}):")
-            for u in all_users:
+            print("👥 Available users (first 50):")
+            for u in db.users.find({}, {"user_id": 1, "email": 1, "_id": 0}).limit(50):
                 print(f"  - {u.get('email')} | ID: {u.get('user_id')}")
         else:
             print(f"✅ User found: {user.get('email')} | Tier: {user.get('subscription_tier')}")
             
-        trades_count = db.trades.count_documents({"user_id": user_id})
+        trades_count = trades_f.result()
         print(f"📊 Trades for user: {trades_count}")
         
-        goals_count = db.goals.count_documents({"user_id": user_id})
+        goals_count = goals_f.result()
         print(f"🎯 Goals for user: {goals_count}")
         
-        mt5_creds = db.mt5_credentials.find_one({"user_id": user_id})
+        mt5_creds = mt5_f.result()
         print(f"🔌 MT5 Linked: {'Yes' if mt5_creds else 'No'}")
         
     except Exception as e:
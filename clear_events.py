@@ -4,8 +4,14 @@ def clear_events():
     db = get_db()
     # Keep sample events, delete others
     # Sample events have IDs like sample_1_...
+    # Two plain anchored prefixes (rather than one grouped alternation) let
+    # the planner turn each branch into an index range scan on unique_id
+    # (the index itself is created by create_indexes.py).
     result = db.economic_events.delete_many({
-        "unique_id": {"$regex": "^(ff_|fh_)"}
+        "$or": [
+            {"unique_id": {"$regex": "^ff_"}},
+            {"unique_id": {"$regex": "^fh_"}}
+        ]
     })
     print(f"Deleted {result.deleted_count} events (Finnhub and FairEconomy).")
 
@@ -0,0 +1,40 @@
+import logging
+from app.mongo_database import get_db
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# One-off migration: run after deploys that add a query pattern, never on the request path.
+# (collection, keys, options)
+INDEXES = [
+    ("trades", [("user_id", 1), ("trade_no", -1)], {}),
+    # Per-user open_time sort in resequence_trades_mongo
+    ("trades", [("user_id", 1), ("open_time", 1)], {}),
+    ("goals", [("user_id", 1), ("is_active", 1), ("goal_type", 1)], {}),
+    # restore_goals; only achieved goals are indexed, so the index stays small
+    ("goals", [("achieved", 1), ("is_active", 1)], {"partialFilterExpression": {"achieved": True}}),
+    ("economic_events", [("event_time_utc", 1)], {}),
+    # Sparse: hand-seeded sample events carry event_id but no unique_id
+    ("economic_events", [("unique_id", 1)], {"unique": True, "sparse": True}),
+    ("mt5_credentials", [("user_id", 1)], {}),
+    ("coupons", [("code", 1)], {"unique": True}),
+    # Backs the first_name lookups in check_user_goals / find_sandip_goals
+    ("users", [("first_name", 1)], {"partialFilterExpression": {"first_name": {"$exists": True}}}),
+]
+
+def create_indexes():
+    db = get_db()
+    if db is None:
+        logger.error("No database connection")
+        return
+
+    for collection, keys, options in INDEXES:
+        # Each index on its own so one failure (e.g. duplicate unique_ids) doesn't skip the rest
+        try:
+            name = db[collection].create_index(keys, **options)
+            logger.info(f"✅ {collection}.{name}")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not create index {keys} on {collection}: {e}")
+
+if __name__ == "__main__":
+    create_indexes()
@@ -19,17 +19,23 @@ def debug_api():
         db = get_db()
         logger.info(f"Connected to DB: {db.name}")
         
-        # 1. Check DB Content
-        count = db.economic_events.count_documents({})
+        # 1. Check DB Content + 2. Date Range of Events, in one round-trip
+        summary = next(db.economic_events.aggregate([
+            {"$facet": {
+                "first": [{"$sort": {"event_time_utc": 1}}, {"$limit": 1}],
+                "last": [{"$sort": {"event_time_utc": -1}}, {"$limit": 1}],
+                "count": [{"$count": "n"}]
+            }}
+        ]))
+        count = summary["count"][0]["n"] if summary["count"] else 0
         logger.info(f"Total events in DB: {count}")
         
         if count == 0:
             logger.warning("DB is empty! Sync failed.")
             return
 
-        # 2. Check Date Range of Events in DB
-        first_event = db.economic_events.find_one(sort=[("event_time_utc", 1)])
-        last_event = db.economic_events.find_one(sort=[("event_time_utc", -1)])
+        first_event = summary["first"][0] if summary["first"] else None
+        last_event = summary["last"][0] if summary["last"] else None
         
         if first_event:
             logger.info(f"First Event in DB: {first_event['event_time_utc']} ({first_event['event_name']})")
@@ -10,6 +10,7 @@ except Exception as e:
     print(f"❌ Connection failed: {e}")
     sys.exit(1)
 
+now = datetime.utcnow()
 code = "ELITE2025"
 print(f"🔍 Checking coupon: {code}")
 
@@ -29,13 +30,13 @@ if coupon:
     if coupon.get("max_uses") and coupon.get("times_used", 0) >= coupon["max_uses"]:
         print("❌ FAIL: Coupon usage limit reached")
         
-    if coupon.get('expires_at') and coupon.get('expires_at') < datetime.utcnow():
+    if coupon.get('expires_at') and coupon.get('expires_at') < now:
         print("❌ FAIL: Coupon EXPIRED")
         
     print("🎉 Coupon should be VALID")
 else:
     print("❌ Coupon NOT found in database")
     # List all coupons to see what exists
-    print("📋 Listing all coupons:")
-    for c in db.coupons.find():
+    print("📋 Listing coupons (first 100):")
+    for c in db.coupons.find({}, {"code": 1, "tier": 1, "_id": 0}).limit(100):
         print(f"   - {c.get('code')} ({c.get('tier')})")
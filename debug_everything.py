@@ -1,6 +1,12 @@
+import sys
 from app.mongo_database import get_db
 
-db = get_db()
-print("--- ALL USERS IN DB ---")
-for u in db.users.find():
-    print(f"Name: {u.get('first_name')} {u.get('last_name')} | ID: {u.get('user_id')} | Email: {u.get('email')}")
+def debug_everything():
+    db = get_db()
+    print("--- ALL USERS IN DB ---")
+    for u in db.users.find({}, {"first_name": 1, "last_name": 1, "user_id": 1, "email": 1, "_id": 0}):
+        print(f"Name: {u.get('first_name')} {u.get('last_name')} | ID: {u.get('user_id')} | Email: {u.get('email')}")
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(line_buffering=False)
+    debug_everything()
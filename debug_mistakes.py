@@ -1,7 +1,7 @@
-from pymongo import MongoClient
+from app.mongo_client import get_client
 
 # Connect to MongoDB
-client = MongoClient('mongodb://localhost:27017/')
+client = get_client('mongodb://localhost:27017/')
 db = client['trading_journal']
 
 # Get recent trades with mistakes
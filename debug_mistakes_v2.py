@@ -1,9 +1,9 @@
-from pymongo import MongoClient
+from app.mongo_client import get_client
 import sys
 
 try:
     # Connect to MongoDB using 127.0.0.1
-    client = MongoClient('mongodb://127.0.0.1:27017/', serverSelectionTimeoutMS=2000)
+    client = get_client('mongodb://127.0.0.1:27017/', serverSelectionTimeoutMS=2000)
     db = client['trading_journal']
     
     # Check connection
@@ -1,15 +1,11 @@
-import sqlite3
 from datetime import datetime
 import pandas as pd
-
-# Database path (assuming standard location relative to backend)
-DB_PATH = "trading_journal.db"
+from app.sqlite_database import connect
 
 def debug_raw():
     try:
         print("--- Debugging Raw SQL ---")
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
+        conn = connect()
         
         # Get table schema to verify columns
         # cursor.execute("PRAGMA table_info(trades)")
@@ -18,15 +14,15 @@ def debug_raw():
         
         # Fetch last 20 trades
         print("\n--- Last 20 Trades ---")
-        cursor.execute("SELECT id, user_id, net_profit, open_time, close_time FROM trades ORDER BY id DESC LIMIT 20")
-        rows = cursor.fetchall()
+        df = pd.read_sql_query(
+            "SELECT id, user_id, net_profit, open_time, close_time FROM trades ORDER BY id DESC LIMIT 20",
+            conn
+        )
         
-        if not rows:
+        if df.empty:
             print("No trades found.")
-        
-        for row in rows:
-            # ID, User, Profit, Open, Close
-            print(f"ID: {row[0]} | User: {row[1]} | Profit: {row[2]} | Open: {row[3]} | Close: {row[4]}")
+        else:
+            print(df.to_string(index=False, na_rep="None"))
             
     except Exception as e:
         print(f"Error: {e}")
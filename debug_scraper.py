@@ -1,22 +1,29 @@
+import shutil
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 url = "https://www.forexfactory.com/calendar?day=today"
 headers = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 }
 
+session = requests.Session()
+session.headers.update(headers)
+
 try:
     print(f"Fetching {url}...")
-    response = requests.get(url, headers=headers, timeout=10)
-    print(f"Status Code: {response.status_code}")
-    
-    with open("ff_debug.html", "w", encoding="utf-8") as f:
-        f.write(response.text)
+    # Stream the body straight to disk instead of holding it in memory
+    with session.get(url, stream=True, timeout=10) as response:
+        print(f"Status Code: {response.status_code}")
+        response.raw.decode_content = True
+        with open("ff_debug.html", "wb") as f:
+            shutil.copyfileobj(response.raw, f)
     print("Saved response to ff_debug.html")
     
-    soup = BeautifulSoup(response.text, 'html.parser')
-    events = soup.select("tr.calendar_row")
+    # Only build the tree for the calendar rows, using the lxml parser
+    with open("ff_debug.html", "rb") as f:
+        soup = BeautifulSoup(f, "lxml", parse_only=SoupStrainer("tr", class_="calendar_row"))
+    events = soup.find_all("tr", class_="calendar_row")
     print(f"Found {len(events)} events in HTML.")
     
 except Exception as e:
@@ -1,14 +1,6 @@
 import sys
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
-
-# Database URL (assuming valid from app.database or hardcoded for debug)
-SQLALCHEMY_DATABASE_URL = "sqlite:///./trading_journal.db"
-
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+from sqlalchemy import text
+from app.sqlite_database import SessionLocal
 
 def debug_trades():
     db = SessionLocal()
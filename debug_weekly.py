@@ -1,17 +1,9 @@
 import sys
-from sqlalchemy import create_engine, text, or_, and_
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import text
 from datetime import datetime, timedelta
-import pandas as pd
-from app.models.trade import Trade
-
-# Database URL
-SQLALCHEMY_DATABASE_URL = "sqlite:///./trading_journal.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+from app.sqlite_database import engine
 
 def debug_weekly():
-    db = SessionLocal()
     try:
         print("--- Debugging Weekly Review Logic ---")
         
@@ -22,36 +14,32 @@ def debug_weekly():
         start_date = end_date - timedelta(days=7)
         print(f"Date Range (for reference): {start_date} to {end_date}")
 
-        # Fetch last 20 trades regardless of date to see what's going on
-        trades = db.query(Trade).order_by(Trade.id.desc()).limit(20).all()
-        
-        if not trades:
-            print("No trades found in database.")
-            return
-
-        print(f"Found {len(trades)} trades in specific user query (showing last 20).")
-        
-        data = []
-        for t in trades:
-            # Check if it WOULD pass the filter
-            ref_time = t.close_time or t.open_time
-            passes = False
-            if ref_time:
-                if ref_time >= start_date:
-                    passes = True
+        with engine.connect() as conn:
+            # Fetch last 20 trades regardless of date to see what's going on,
+            # flagging in SQL whether each WOULD pass the filter
+            rows = conn.execute(text(
+                "SELECT id, user_id, open_time, close_time, net_profit, "
+                "COALESCE(close_time, open_time) >= :s AS passes "
+                "FROM trades ORDER BY id DESC LIMIT 20"
+            ), {"s": start_date}).fetchall()
             
-            print(f"ID: {t.id} | User: {t.user_id} | Open: {t.open_time} | Close: {t.close_time} | P&L: {t.net_profit} | Passes Filter: {passes}")
-            data.append({"net_profit": t.net_profit or 0})
+            if not rows:
+                print("No trades found in database.")
+                return
+
+            print(f"Found {len(rows)} trades in specific user query (showing last 20).")
+            for r in rows:
+                print(f"ID: {r.id} | User: {r.user_id} | Open: {r.open_time} | Close: {r.close_time} | P&L: {r.net_profit} | Passes Filter: {bool(r.passes)}")
             
-        if data:
-            df = pd.DataFrame(data)
-            worst_val = df['net_profit'].min()
+            # Let SQLite compute the worst trade of the window in C
+            worst_val = conn.execute(
+                text("SELECT MIN(net_profit) FROM trades WHERE COALESCE(close_time, open_time) >= :s"),
+                {"s": start_date}
+            ).scalar()
             print(f"Calculated Worst Trade Profit: {worst_val}")
             
     except Exception as e:
         print(f"Error: {e}")
-    finally:
-        db.close()
 
 if __name__ == "__main__":
     debug_weekly()
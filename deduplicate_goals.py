@@ -5,20 +5,22 @@ def hunt_duplicates():
     target_id = "e5a933cf-d99e-4b85-a2ff-379efbe82e0b"
     
     print(f"--- HUNTING DUPLICATES FOR {target_id} ---")
-    goals = list(db.goals.find({"user_id": target_id, "is_active": True}))
-    print(f"Total active goals found: {len(goals)}")
+    # Let the server group active goals by type and hand back only the
+    # ObjectIds that lose to the oldest goal of each type.
+    groups = db.goals.aggregate([
+        {"$match": {"user_id": target_id, "is_active": True}},
+        {"$sort": {"_id": 1}},
+        {"$group": {"_id": "$goal_type", "keep": {"$first": "$_id"}, "all": {"$push": "$_id"}}},
+        {"$project": {"keep": 1, "dupes": {"$setDifference": ["$all", ["$keep"]]}}}
+    ])
     
-    types_found = {}
     duplicates_to_remove = []
     
-    for g in goals:
-        g_type = g.get("goal_type")
-        if g_type in types_found:
-            print(f"DUPLICATE FOUND: {g_type} | ID: {g.get('_id')}")
-            duplicates_to_remove.append(g.get("_id"))
-        else:
-            types_found[g_type] = g.get("_id")
-            print(f"KEEPING: {g_type} | ID: {g.get('_id')}")
+    for grp in groups:
+        print(f"KEEPING: {grp['_id']} | ID: {grp['keep']}")
+        for dupe_id in grp["dupes"]:
+            print(f"DUPLICATE FOUND: {grp['_id']} | ID: {dupe_id}")
+            duplicates_to_remove.append(dupe_id)
             
     if duplicates_to_remove:
         print(f"\nRemoving {len(duplicates_to_remove)} duplicate(s)...")
@@ -4,8 +4,11 @@ from bson import json_util
 
 def deep_check():
     db = get_db()
-    goals = list(db.goals.find())
-    print(json.dumps(goals, default=json_util.default, indent=2))
+    # Stream the JSON array one goal at a time instead of holding the whole collection
+    print("[")
+    for i, g in enumerate(db.goals.find().batch_size(2000)):
+        print(("," if i else "") + json.dumps(g, default=json_util.default, indent=2))
+    print("]")
 
 if __name__ == "__main__":
     deep_check()
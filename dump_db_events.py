@@ -24,10 +24,10 @@ def dump_events():
         print(f"Total events: {count}", flush=True)
         
         # Dump all events sorted by time
-        events = list(db.economic_events.find().sort("event_time_utc", 1))
+        cursor = db.economic_events.find().sort("event_time_utc", 1).batch_size(6000)
         
         print("\n--- Events Dump ---")
-        for e in events:
+        for e in cursor:
             # Print unique_id, time, name
             print(f"[{e.get('event_time_utc')}] {e.get('event_name')} (ID: {e.get('unique_id')})")
             
@@ -35,4 +35,5 @@ def dump_events():
         print(f"Error: {e}")
 
 if __name__ == "__main__":
+    sys.stdout.reconfigure(line_buffering=False)
     dump_events()
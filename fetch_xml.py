@@ -2,9 +2,10 @@ import requests
 
 url = "https://nfs.faireconomy.media/ff_calendar_thisweek.xml"
 try:
-    response = requests.get(url)
-    with open("ff_feed.xml", "wb") as f:
-        f.write(response.content)
+    # Write the feed to disk as it arrives rather than buffering the whole body
+    with requests.get(url, stream=True, timeout=30) as response, open("ff_feed.xml", "wb") as f:
+        for chunk in response.iter_content(chunk_size=65536):
+            f.write(chunk)
     print("Saved XML feed to ff_feed.xml")
 except Exception as e:
     print(f"Error: {e}")
@@ -1,9 +1,13 @@
+import sys
+from pymongo import UpdateOne, UpdateMany
 from app.mongo_database import get_db
 
 def final_fix():
     db = get_db()
     # Find all users
     users = list(db.users.find())
+    # Every write is queued here and shipped in one unordered bulk_write
+    ops = []
     for user in users:
         u_id = user.get("user_id")
         if not u_id: continue
@@ -19,7 +23,7 @@ def final_fix():
             goals = list(db.goals.find({"user_id": obj_id}))
             if goals:
                 print(f"Migrating goals from ObjectId {obj_id} to UUID {u_id}")
-                db.goals.update_many({"user_id": obj_id}, {"$set": {"user_id": u_id}})
+                ops.append(UpdateMany({"user_id": obj_id}, {"$set": {"user_id": u_id}}))
         
         # Standardize existing goals
         for g in goals:
@@ -39,8 +43,13 @@ def final_fix():
                 # Default to monthly if unknown
                 updates["goal_type"] = "monthly"
                 
-            db.goals.update_one({"_id": g["_id"]}, {"$set": updates})
-            print(f"Updated goal {g.get('_id')} for {user.get('first_name')}")
+            ops.append(UpdateOne({"_id": g["_id"]}, {"$set": updates}))
+            print(f"Queued update for goal {g.get('_id')} for {user.get('first_name')}")
+    
+    if ops:
+        res = db.goals.bulk_write(ops, ordered=False)
+        print(f"Applied {len(ops)} goal write(s), modified {res.modified_count} document(s)")
 
 if __name__ == "__main__":
+    sys.stdout.reconfigure(line_buffering=False)
     final_fix()
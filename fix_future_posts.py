@@ -1,39 +1,27 @@
-from pymongo import MongoClient
+from app.config import MONGO_URI, DB_NAME
+from app.mongo_client import get_client
 from datetime import datetime, timezone
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-MONGO_URI = os.getenv("MONGO_URI")
-DB_NAME = os.getenv("DB_NAME", "journal")
 
 def fix_future_timestamps():
-    client = MongoClient(MONGO_URI)
+    client = get_client(MONGO_URI)
     db = client[DB_NAME]
     
     now = datetime.now(timezone.utc)
     print(f"🕒 Current UTC Time: {now}")
     
+    future_filter = {"created_at": {"$gt": now}}
+    
     # 1. Fix Posts
-    future_posts = list(db.posts.find({"created_at": {"$gt": now}}))
-    print(f"📝 Found {len(future_posts)} future posts.")
-    for post in future_posts:
+    for post in db.posts.find(future_filter, {"post_id": 1, "created_at": 1, "_id": 0}):
         print(f"  - Fixing post {post.get('post_id')} (was {post.get('created_at')})")
-        db.posts.update_one(
-            {"_id": post["_id"]},
-            {"$set": {"created_at": now}}
-        )
+    res = db.posts.update_many(future_filter, {"$currentDate": {"created_at": True}})
+    print(f"📝 Fixed {res.modified_count} future posts.")
         
     # 2. Fix Comments
-    future_comments = list(db.post_comments.find({"created_at": {"$gt": now}}))
-    print(f"💬 Found {len(future_comments)} future comments.")
-    for comment in future_comments:
+    for comment in db.post_comments.find(future_filter, {"comment_id": 1, "created_at": 1, "_id": 0}):
         print(f"  - Fixing comment {comment.get('comment_id')} (was {comment.get('created_at')})")
-        db.post_comments.update_one(
-            {"_id": comment["_id"]},
-            {"$set": {"created_at": now}}
-        )
+    res = db.post_comments.update_many(future_filter, {"$currentDate": {"created_at": True}})
+    print(f"💬 Fixed {res.modified_count} future comments.")
         
     print("✅ Done.")
 
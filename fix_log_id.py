@@ -11,8 +11,7 @@ def log_id_fix():
     else:
         print(f"User for log_id {log_id} NOT FOUND in production users collection.")
         # Check by first_name again to see all IDs
-        sandips = list(db.users.find({"first_name": "Sandip"}))
-        for s in sandips:
+        for s in db.users.find({"first_name": "Sandip"}, {"user_id": 1, "email": 1, "_id": 0}):
              print(f"Found Sandip: UUID={s.get('user_id')}, Email={s.get('email')}")
 
     # Check goals for the specific ID from logs
@@ -24,20 +23,25 @@ def log_id_fix():
     # Broad fix: Any goal with target_amount 0.0 or None should be set to a default to ensure visibility
     # This acts as a catch-all safety net.
     
-    # Actually, let's just surgically fix THIS ID from logs
-    if not goals or any(g.get('target_amount') in [0, 0.0, None] for g in goals):
-        print("\nSurgically fixing goals for log_id...")
+    # Actually, let's just surgically fix THIS ID from logs.
+    # The zero/missing-target check runs inside the update pipeline, so a
+    # goal that already has a real target is left untouched.
+    print("\nSurgically fixing goals for log_id...")
+    for goal_type, default_target in (("weekly", 500.0), ("monthly", 2000.0)):
         db.goals.update_one(
-            {"user_id": log_id, "goal_type": "weekly"},
-            {"$set": {"target_amount": 500.0, "is_active": True, "achieved": False}},
+            {"user_id": log_id, "goal_type": goal_type},
+            [
+                {"$set": {"_needs_fix": {"$in": [{"$ifNull": ["$target_amount", None]}, [None, 0, 0.0]]}}},
+                {"$set": {
+                    "target_amount": {"$cond": ["$_needs_fix", default_target, "$target_amount"]},
+                    "is_active": {"$cond": ["$_needs_fix", True, "$is_active"]},
+                    "achieved": {"$cond": ["$_needs_fix", False, "$achieved"]}
+                }},
+                {"$unset": "_needs_fix"}
+            ],
             upsert=True
         )
-        db.goals.update_one(
-            {"user_id": log_id, "goal_type": "monthly"},
-            {"$set": {"target_amount": 2000.0, "is_active": True, "achieved": False}},
-            upsert=True
-        )
-        print("Done.")
+    print("Done.")
 
 if __name__ == "__main__":
     log_id_fix()
@@ -1,3 +1,4 @@
+import sys
 from app.mongo_database import get_db
 
 def hunt_mysterious_id():
@@ -14,7 +15,7 @@ def hunt_mysterious_id():
         print("USER NOT FOUND in 'users' collection.")
         # Try finding by first name again to see ALL Sandips and their IDs
         print("\nListing all Sandips:")
-        for s in db.users.find({"first_name": "Sandip"}):
+        for s in db.users.find({"first_name": "Sandip"}, {"first_name": 1, "user_id": 1, "email": 1, "_id": 0}):
             print(f" - {s.get('first_name')} | ID: {s.get('user_id')} | Email: {s.get('email')}")
 
     # 2. Search in goals
@@ -28,4 +29,5 @@ def hunt_mysterious_id():
     print(f"\nTRADES FOUND for {target_id}: {trades_count}")
 
 if __name__ == "__main__":
+    sys.stdout.reconfigure(line_buffering=False)
     hunt_mysterious_id()
@@ -1,40 +1,36 @@
-from pymongo import MongoClient
+from pymongo import ReplaceOne
+from app.mongo_client import get_client
 from datetime import datetime, timedelta, timezone
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
+from app.config import MONGO_URI, DB_NAME
 
 # Connect to MongoDB
-mongo_uri = os.getenv("MONGO_URI") or "mongodb://localhost:27017/"
-client = MongoClient(mongo_uri)
+mongo_uri = MONGO_URI or "mongodb://localhost:27017/"
+client = get_client(mongo_uri)
 
-db_name = os.getenv("DB_NAME", "JournalX")
+db_name = DB_NAME
 # Fallback to finding the journal database if default name not found
-if db_name not in client.list_database_names():
-    for name in client.list_database_names():
-        if "journal" in name.lower():
-            db_name = name
-            break
+db_names = client.list_database_names()
+if db_name not in db_names:
+    db_name = next((name for name in db_names if "journal" in name.lower()), db_name)
 
 db = client[db_name]
 print(f"Using database: {db_name}")
 
 # Create sample events
-now = datetime.now(timezone.utc)
+now = datetime.now(timezone.utc).replace(microsecond=0)
 today_str = now.strftime("%Y-%m-%d")
 tomorrow_str = (now + timedelta(days=1)).strftime("%Y-%m-%d")
-
-# Clean existing sample events to avoid duplicates
-db.economic_events.delete_many({"event_id": {"$regex": "^test_"}})
-print("Cleaned up old test events.")
+now_iso = now.isoformat()
+yesterday = now - timedelta(days=1)
+yesterday_str = yesterday.strftime("%Y-%m-%d")
+yesterday_2pm_iso = yesterday.replace(hour=14, minute=0).isoformat()
 
 sample_events = [
     # YESTERDAY (Past)
     {
         "event_id": "test_prev_1",
-        "event_date": (now - timedelta(days=1)).strftime("%Y-%m-%d"),
-        "event_time_utc": (now - timedelta(days=1)).replace(hour=14, minute=0).isoformat(),
+        "event_date": yesterday_str,
+        "event_time_utc": yesterday_2pm_iso,
         "country": "US",
         "currency": "USD",
         "impact_level": "medium",
@@ -43,9 +39,9 @@ sample_events = [
         "forecast": "7.4T",
         "previous": "7.4T",
         "status": "released",
-        "fetched_at": now.isoformat(),
-        "created_at": now.isoformat(),
-        "updated_at": now.isoformat()
+        "fetched_at": now_iso,
+        "created_at": now_iso,
+        "updated_at": now_iso
     },
     # TODAY (Upcoming relative to UTC now, maybe passed in local)
     {
@@ -60,9 +56,9 @@ sample_events = [
         "forecast": "0.3%",
         "previous": "0.2%",
         "status": "upcoming",
-        "fetched_at": now.isoformat(),
-        "created_at": now.isoformat(),
-        "updated_at": now.isoformat()
+        "fetched_at": now_iso,
+        "created_at": now_iso,
+        "updated_at": now_iso
     },
     {
         "event_id": "test_today_2",
@@ -76,9 +72,9 @@ sample_events = [
         "forecast": "3.1%",
         "previous": "3.4%",
         "status": "upcoming",
-        "fetched_at": now.isoformat(),
-        "created_at": now.isoformat(),
-        "updated_at": now.isoformat()
+        "fetched_at": now_iso,
+        "created_at": now_iso,
+        "updated_at": now_iso
     },
     {
         "event_id": "test_today_3",
@@ -92,9 +88,9 @@ sample_events = [
         "forecast": None,
         "previous": None,
         "status": "upcoming",
-        "fetched_at": now.isoformat(),
-        "created_at": now.isoformat(),
-        "updated_at": now.isoformat()
+        "fetched_at": now_iso,
+        "created_at": now_iso,
+        "updated_at": now_iso
     },
     # TOMORROW
     {
@@ -109,16 +105,17 @@ sample_events = [
         "forecast": "180K",
         "previous": "175K",
         "status": "upcoming",
-        "fetched_at": now.isoformat(),
-        "created_at": now.isoformat(),
-        "updated_at": now.isoformat()
+        "fetched_at": now_iso,
+        "created_at": now_iso,
+        "updated_at": now_iso
     }
 ]
 
-# Insert events
+# Upsert events by event_id: idempotent on re-runs, no separate delete pass
 try:
-    result = db.economic_events.insert_many(sample_events)
-    print(f"Inserted {len(result.inserted_ids)} sample events.")
+    ops = [ReplaceOne({"event_id": ev["event_id"]}, ev, upsert=True) for ev in sample_events]
+    result = db.economic_events.bulk_write(ops, ordered=False)
+    print(f"Upserted {len(ops)} sample events ({result.upserted_count} new, {result.modified_count} replaced).")
     
     # Verify count
     count = db.economic_events.count_documents({})
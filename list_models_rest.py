@@ -1,10 +1,8 @@
-import os
-import requests
-from dotenv import load_dotenv
+from pathlib import Path
+from app.config import GEMINI_API_KEY
+from app.http_session import get_session, DEFAULT_TIMEOUT
 
-load_dotenv()
-
-api_key = os.getenv("GEMINI_API_KEY")
+api_key = GEMINI_API_KEY
 if not api_key:
     print("❌ Error: GEMINI_API_KEY not found.")
     exit(1)
@@ -14,16 +12,15 @@ url = f"https://generativelanguage.googleapis.com/v1beta/models?key={api_key}"
 print(f"📡 Requesting: {url}")
 
 try:
-    response = requests.get(url)
+    response = get_session().get(url, timeout=DEFAULT_TIMEOUT)
     print(f"📊 Status Code: {response.status_code}")
     if response.status_code == 200:
-        models = response.json()
+        names = [m["name"] for m in response.json().get("models", [])]
+        listing = "\n".join(f"- {n}" for n in names)
         print("✅ Models available:")
-        with open("models_list.txt", "w", encoding="utf-8") as f:
-            for m in models.get("models", []):
-                line = f"- {m['name']}\n"
-                print(line.strip())
-                f.write(line)
+        print(listing)
+        # One write for the whole listing instead of one per model
+        Path("models_list.txt").write_text(listing + "\n", encoding="utf-8")
     else:
         print(f"❌ Error Response: {response.text}")
 except Exception as e:
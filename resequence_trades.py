@@ -2,111 +2,80 @@
 Script to re-sequence trade_no to ensure proper sequential numbering from 1
 """
 
-import psycopg2
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
+from app.config import DB_HOST, DB_NAME
+from app.pg_pool import pg_connection
 
 def resequence_trade_numbers():
     """Re-sequence trade_no to be 1, 2, 3, ... in order"""
     
     print("🔄 Re-sequencing trade numbers...")
     
-    # Get database credentials
-    db_user = os.getenv('DB_USER')
-    db_password = os.getenv('DB_PASSWORD')
-    db_host = os.getenv('DB_HOST')
-    db_name = os.getenv('DB_NAME')
-    
-    print(f"📡 Connecting to database: {db_host}/{db_name}")
+    print(f"📡 Connecting to database: {DB_HOST}/{DB_NAME}")
     
     try:
-        # Connect to database
-        conn = psycopg2.connect(
-            host=db_host,
-            database=db_name,
-            user=db_user,
-            password=db_password
-        )
-        conn.autocommit = False
-        cursor = conn.cursor()
-        
-        # Get all trades ordered by creation (id or open_time)
-        print("\n1️⃣ Fetching all trades...")
-        cursor.execute("""
-            SELECT id, trade_no, symbol, open_time 
-            FROM trades 
-            ORDER BY open_time, id
-        """)
-        trades = cursor.fetchall()
-        
-        print(f"📊 Found {len(trades)} trades")
-        print("\nCurrent trade numbers:")
-        for trade in trades:
-            print(f"  ID: {trade[0]}, Trade No: {trade[1]}, Symbol: {trade[2]}, Time: {trade[3]}")
-        
-        # Temporarily drop the unique constraint
-        print("\n2️⃣ Temporarily removing unique constraint...")
-        cursor.execute("""
-            ALTER TABLE trades 
-            DROP CONSTRAINT IF EXISTS trades_trade_no_unique
-        """)
-        
-        # Re-assign sequential numbers
-        print("\n3️⃣ Re-assigning sequential trade numbers (1, 2, 3, ...)...")
-        for new_trade_no, (trade_id, old_trade_no, symbol, open_time) in enumerate(trades, start=1):
+        # Borrow a pooled connection; it is rolled back on error and always returned
+        with pg_connection() as conn, conn.cursor() as cursor:
+            conn.autocommit = False
+            
+            # Count trades (the UPDATE below does the ordering server-side)
+            print("\n1️⃣ Counting trades...")
+            cursor.execute("SELECT COUNT(*) FROM trades")
+            total = cursor.fetchone()[0]
+            
+            print(f"📊 Found {total} trades")
+            
+            # Temporarily drop the unique constraint
+            print("\n2️⃣ Temporarily removing unique constraint...")
             cursor.execute("""
-                UPDATE trades 
-                SET trade_no = %s 
-                WHERE id = %s
-            """, (new_trade_no, trade_id))
-            print(f"  ✓ Trade ID {trade_id} ({symbol}): {old_trade_no} → {new_trade_no}")
-        
-        # Re-add the unique constraint
-        print("\n4️⃣ Re-adding unique constraint...")
-        cursor.execute("""
-            ALTER TABLE trades 
-            ADD CONSTRAINT trades_trade_no_unique UNIQUE (trade_no)
-        """)
-        
-        # Commit all changes
-        conn.commit()
-        
-        # Verify the new sequence
-        print("\n5️⃣ Verifying new sequence...")
-        cursor.execute("""
-            SELECT id, trade_no, symbol, open_time 
-            FROM trades 
-            ORDER BY trade_no
-        """)
-        updated_trades = cursor.fetchall()
-        
-        print("\n✅ New trade numbers:")
-        for trade in updated_trades:
-            print(f"  Trade No: {trade[1]}, ID: {trade[0]}, Symbol: {trade[2]}, Time: {trade[3]}")
-        
-        # Check for gaps
-        trade_numbers = [t[1] for t in updated_trades]
-        expected = list(range(1, len(updated_trades) + 1))
-        
-        if trade_numbers == expected:
-            print(f"\n✅ Perfect! Trade numbers are sequential from 1 to {len(updated_trades)}")
-        else:
-            print(f"\n⚠️  Warning: Trade numbers are not perfectly sequential")
-            print(f"   Expected: {expected}")
-            print(f"   Got: {trade_numbers}")
-        
-        cursor.close()
-        conn.close()
-        
-        print(f"\n🎉 Re-sequencing completed successfully!")
+                ALTER TABLE trades 
+                DROP CONSTRAINT IF EXISTS trades_trade_no_unique
+            """)
+            
+            # Re-assign sequential numbers
+            print("\n3️⃣ Re-assigning sequential trade numbers (1, 2, 3, ...)...")
+            # Number rows server-side in a single set-based UPDATE
+            cursor.execute("""
+                WITH s AS (
+                    SELECT id, ROW_NUMBER() OVER (ORDER BY open_time, id) AS rn
+                    FROM trades
+                )
+                UPDATE trades t
+                SET trade_no = s.rn
+                FROM s
+                WHERE t.id = s.id
+            """)
+            print(f"✅ Resequenced {cursor.rowcount} trades")
+            
+            # Re-add the unique constraint
+            print("\n4️⃣ Re-adding unique constraint...")
+            cursor.execute("""
+                ALTER TABLE trades 
+                ADD CONSTRAINT trades_trade_no_unique UNIQUE (trade_no)
+            """)
+            
+            # Commit all changes
+            conn.commit()
+            
+            # Verify the new sequence
+            print("\n5️⃣ Verifying new sequence...")
+            # Sequential 1..N without gaps or repeats <=> min=1, max=N, N distinct
+            cursor.execute("""
+                SELECT MIN(trade_no), MAX(trade_no), COUNT(*), COUNT(DISTINCT trade_no)
+                FROM trades
+            """)
+            min_no, max_no, count, distinct = cursor.fetchone()
+            
+            if count == 0 or (min_no == 1 and max_no == count and distinct == count):
+                print(f"\n✅ Perfect! Trade numbers are sequential from 1 to {count}")
+            else:
+                print(f"\n⚠️  Warning: Trade numbers are not perfectly sequential")
+                print(f"   Expected: 1..{count} ({count} distinct)")
+                print(f"   Got: {min_no}..{max_no} ({distinct} distinct)")
+            
+            print(f"\n🎉 Re-sequencing completed successfully!")
         
     except Exception as e:
         print(f"\n❌ Re-sequencing failed: {str(e)}")
-        if 'conn' in locals():
-            conn.rollback()
-            conn.close()
         raise
 
 if __name__ == "__main__":
@@ -1,8 +1,5 @@
-import os
-from dotenv import load_dotenv
-from pymongo import MongoClient
-
-load_dotenv()
+from app.mongo_client import get_client
+from app.config import MONGO_URI, DB_NAME
 
 def resequence_trades_mongo():
     """
@@ -12,12 +9,12 @@ def resequence_trades_mongo():
     
     # Connect using same env vars as app
     # Or hardcode default if env not set for script
-    uri = os.getenv("MONGO_URI", "mongodb://localhost:27017")
-    db_name = os.getenv("DB_NAME", "JournalX")
+    uri = MONGO_URI or "mongodb://localhost:27017"
+    db_name = DB_NAME
     
     print(f"📡 Connecting to MongoDB at {uri}...")
     try:
-        client = MongoClient(uri, serverSelectionTimeoutMS=5000)
+        client = get_client(uri)
         client.admin.command('ping')
         print(f"✅ Connected to MongoDB!")
     except Exception as e:
@@ -26,38 +23,21 @@ def resequence_trades_mongo():
 
     db = client[db_name]
     
-    # Get all distinct users
-    users = db.trades.distinct("user_id")
-    print(f"👥 Found {len(users)} users with trades.")
-    
-    total_updated = 0
-    
-    for user_id in users:
-        print(f"\n👤 Processing user: {user_id}")
-        
-        # Get trades for user, sorted by time
-        trades = list(db.trades.find({"user_id": user_id}).sort("open_time", 1))
-        
-        if not trades:
-            continue
-            
-        print(f"   Found {len(trades)} trades.")
-        
-        # Update each trade with new sequence
-        for index, trade in enumerate(trades):
-            new_no = index + 1
-            old_no = trade.get('trade_no')
-            
-            if old_no != new_no:
-                db.trades.update_one(
-                    {"_id": trade["_id"]},
-                    {"$set": {"trade_no": new_no}}
-                )
-                print(f"   Trade {trade.get('symbol')} ({trade.get('open_time')}): #{old_no} -> #{new_no}")
-                total_updated += 1
+    # Number every user's trades inside the server in one pipeline and merge
+    # back only the ones whose trade_no changes; nothing round-trips to Python.
+    # ($setWindowFields needs MongoDB 5.0+.)
+    db.trades.aggregate([
+        {"$setWindowFields": {
+            "partitionBy": "$user_id",
+            "sortBy": {"open_time": 1},
+            "output": {"new_trade_no": {"$documentNumber": {}}}
+        }},
+        {"$match": {"$expr": {"$ne": ["$trade_no", "$new_trade_no"]}}},
+        {"$project": {"_id": 1, "trade_no": "$new_trade_no"}},
+        {"$merge": {"into": "trades", "on": "_id", "whenMatched": "merge", "whenNotMatched": "discard"}}
+    ])
     
-    print(f"\n✅ Resequencing complete. Updated {total_updated} trades.")
-    client.close()
+    print("\n✅ Resequencing complete.")
 
 if __name__ == "__main__":
     resequence_trades_mongo()
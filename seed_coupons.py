@@ -1,16 +1,14 @@
-from pymongo import MongoClient
-import os
-from datetime import datetime
-from dotenv import load_dotenv
+from pymongo import UpdateOne
+from app.mongo_client import get_client
+from datetime import datetime, timezone
+from app.config import MONGO_URI, DB_NAME
 
-load_dotenv()
-
-MONGO_URI = os.getenv("MONGO_URI", "mongodb://localhost:27017")
-DB_NAME = os.getenv("DB_NAME", "JournalX")
-
-client = MongoClient(MONGO_URI)
+client = get_client(MONGO_URI or "mongodb://localhost:27017")
 db = client[DB_NAME]
 
+# One timestamp shared by every seeded coupon
+CREATED_AT = datetime.now(timezone.utc).replace(microsecond=0)
+
 def seed_coupons():
     coupons = [
         {
@@ -20,7 +18,7 @@ def seed_coupons():
             "max_uses": 100,
             "times_used": 0,
             "is_active": True,
-            "created_at": datetime.utcnow()
+            "created_at": CREATED_AT
         },
         {
             "code": "ELITE2025",
@@ -29,7 +27,7 @@ def seed_coupons():
             "max_uses": 50,
             "times_used": 0,
             "is_active": True,
-            "created_at": datetime.utcnow()
+            "created_at": CREATED_AT
         },
         {
             "code": "WELCOME_OFFER",
@@ -38,22 +36,15 @@ def seed_coupons():
             "max_uses": 1000,
             "times_used": 0,
             "is_active": True,
-            "created_at": datetime.utcnow()
+            "created_at": CREATED_AT
         }
     ]
 
     print(f"🌱 Seeding {len(coupons)} coupons...")
     
-    for coupon in coupons:
-        result = db.coupons.update_one(
-            {"code": coupon["code"]},
-            {"$set": coupon},
-            upsert=True
-        )
-        if result.upserted_id:
-            print(f"   Created: {coupon['code']}")
-        else:
-            print(f"   Updated: {coupon['code']}")
+    ops = [UpdateOne({"code": c["code"]}, {"$set": c}, upsert=True) for c in coupons]
+    result = db.coupons.bulk_write(ops, ordered=False)
+    print(f"   Created: {result.upserted_count}, Updated: {result.matched_count}")
 
     print("✅ Coupon seeding complete!")
 
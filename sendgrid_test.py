@@ -1,12 +1,8 @@
-import os
 from sendgrid import SendGridAPIClient
 from sendgrid.helpers.mail import Mail
-from dotenv import load_dotenv
+from app.config import SENDGRID_API_KEY
 
-# Load environment variables
-load_dotenv()
-
-api_key = os.getenv("SENDGRID_API_KEY")
+api_key = SENDGRID_API_KEY
 print("API Key Loaded:", bool(api_key))  # check if .env key is found
 
 message = Mail(
@@ -9,23 +9,32 @@ def simulate_api():
     # Simulate the get_user_goals endpoint logic
     # (Copy-pasted from app/routes/goals.py)
     
-    # Reactivate
+    # Reactivate + Fix Nulls + Ultra-Repair as one pipeline update, so the
+    # server does the per-goal logic instead of a fetch + update_one loop.
+    # Stage 1 reads the original target_amount for the reactivation check.
     db.goals.update_many(
-        {"user_id": target_id, "is_active": False, "target_amount": {"$gt": 0}},
-        {"$set": {"is_active": True}}
+        {"user_id": target_id},
+        [
+            {"$set": {
+                "is_active": {"$cond": [{"$gt": ["$target_amount", 0]}, True, "$is_active"]},
+                "target_amount": {"$ifNull": ["$target_amount", 0.0]}
+            }},
+            {"$set": {
+                "target_amount": {"$cond": [
+                    {"$and": [{"$eq": ["$is_active", True]}, {"$eq": ["$target_amount", 0]}]},
+                    {"$toDouble": {"$switch": {
+                        "branches": [
+                            {"case": {"$gt": ["$weekly_profit_target", 0]}, "then": "$weekly_profit_target"},
+                            {"case": {"$gt": ["$monthly_profit_target", 0]}, "then": "$monthly_profit_target"},
+                            {"case": {"$eq": ["$goal_type", "weekly"]}, "then": 500.0}
+                        ],
+                        "default": 2000.0
+                    }}},
+                    "$target_amount"
+                ]}
+            }}
+        ]
     )
-    # Fix Nulls
-    db.goals.update_many(
-        {"user_id": target_id, "target_amount": None},
-        {"$set": {"target_amount": 0.0}}
-    )
-    # Ultra-Repair
-    active_zeros = list(db.goals.find({"user_id": target_id, "is_active": True, "target_amount": {"$in": [0, 0.0, None]}}))
-    for az in active_zeros:
-        target = az.get("weekly_profit_target") or az.get("monthly_profit_target") or 0.0
-        if target == 0:
-            target = 500.0 if az.get("goal_type") == "weekly" else 2000.0
-        db.goals.update_one({"_id": az["_id"]}, {"$set": {"target_amount": float(target)}})
         
     # Final Fetch
     goals = list(db.goals.find({"user_id": target_id, "is_active": True}))
@@ -1,4 +1,7 @@
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from app.http_session import get_session, DEFAULT_TIMEOUT
+
+session = get_session()
 
 def test_binance():
     url = "https://api-gcp.binance.com/api/v3/klines"
@@ -8,9 +11,8 @@ def test_binance():
         "limit": 1
     }
     try:
-        r = requests.get(url, params=params, timeout=10)
-        print(f"Binance Status: {r.status_code}")
-        print(f"Binance Data: {r.json()[:1]}")
+        r = session.get(url, params=params, timeout=DEFAULT_TIMEOUT)
+        print(f"Binance Status: {r.status_code}\nBinance Data: {r.json()[:1]}")
     except Exception as e:
         print(f"Binance Error: {e}")
 
@@ -22,11 +24,12 @@ def test_kucoin():
         "limit": 1
     }
     try:
-        r = requests.get(url, params=params, timeout=10)
-        print(f"KuCoin Status: {r.status_code}")
-        print(f"KuCoin Data: {r.json().get('data', [])[:1]}")
+        r = session.get(url, params=params, timeout=DEFAULT_TIMEOUT)
+        print(f"KuCoin Status: {r.status_code}\nKuCoin Data: {r.json().get('data', [])[:1]}")
     except Exception as e:
         print(f"KuCoin Error: {e}")
 
-test_binance()
-test_kucoin()
+# Both probes are pure network wait, so overlap them
+with ThreadPoolExecutor(max_workers=2) as pool:
+    pool.submit(test_binance)
+    pool.submit(test_kucoin)
@@ -1,5 +1,5 @@
-import requests
 import json
+from app.http_session import get_session, DEFAULT_TIMEOUT
 
 URL = "http://localhost:8000/api/calendar/events"
 USER_ID = "test_user" # We need to check if authentication is required or what user_id to use
@@ -14,7 +14,7 @@ def test_api():
     
     print(f"Testing API: {URL} with params {params}")
     try:
-        response = requests.get(URL, params=params)
+        response = get_session().get(URL, params=params, timeout=DEFAULT_TIMEOUT)
         print(f"Status Code: {response.status_code}")
         
         if response.status_code == 200:
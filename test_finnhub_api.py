@@ -1,11 +1,44 @@
-import requests
 import json
+import os
 from datetime import datetime, timedelta
+from app.config import FINNHUB_API_KEY
+from app.http_session import get_session
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+try:
+    from requests_cache import CachedSession
+    HAS_REQUESTS_CACHE = True
+except ImportError:
+    HAS_REQUESTS_CACHE = False
 
-API_KEY = "d0sa91pr01qkkplu0drgd0sa91pr01qkkplu0ds0"
+API_KEY = FINNHUB_API_KEY
 URL = "https://finnhub.io/api/v1/calendar/economic"
 
+# Opt-in: reuse identical same-window responses from a local SQLite cache for this many seconds
+CACHE_TTL = int(os.getenv("FINNHUB_CACHE_TTL", "0"))
+# The full calendar body is large; only dump it when VERBOSE=1
+VERBOSE = os.getenv("VERBOSE") == "1"
+
+def get_http_session():
+    if CACHE_TTL > 0 and HAS_REQUESTS_CACHE:
+        # Keep the API token out of the cache keys and the stored requests
+        return CachedSession("finnhub_cache", backend="sqlite", expire_after=CACHE_TTL, ignored_parameters=["token"])
+    return get_session()
+
+def pretty(obj):
+    # orjson is much faster on the multi-hundred-KB calendar payloads when available
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
 def test_finnhub():
+    if not API_KEY:
+        print("FINNHUB_API_KEY not set")
+        return
+    
     # Fetch events for the current week
     today = datetime.now()
     start_date = (today - timedelta(days=2)).strftime("%Y-%m-%d")
@@ -19,16 +52,18 @@ def test_finnhub():
     
     print(f"Fetching events from {start_date} to {end_date}...")
     try:
-        response = requests.get(URL, params=params)
+        response = get_http_session().get(URL, params=params, timeout=15)
         print(f"Status Code: {response.status_code}")
         data = response.json()
-        print("Response Body:", json.dumps(data, indent=2))
+        if VERBOSE:
+            print("Response Body:", pretty(data))
         
         if response.status_code == 200:
-            print(f"Total events found: {len(data.get('economicCalendar', []))}")
-            if data.get('economicCalendar'):
+            events = data.get('economicCalendar') or []
+            print(f"Total events found: {len(events)}")
+            if events:
                 print("\nFirst event sample:")
-                print(json.dumps(data['economicCalendar'][0], indent=2))
+                print(pretty(events[0]))
         else:
             print(f"Request failed with status {response.status_code}")
             
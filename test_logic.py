@@ -11,24 +11,25 @@ class MockDB:
         self.trades = self
         self.mistakes = self
         
+        now = datetime.utcnow()
         self.trade_data = [
             # Trade with multiple mistakes
             {
                 "user_id": "1", 
                 "mistake": "Overtrading, FOMO Entry",
-                "close_time": datetime.utcnow()
+                "close_time": now
             },
             # Trade with single mistake
             {
                 "user_id": "1", 
                 "mistake": "Revenge Trading",
-                "close_time": datetime.utcnow()
+                "close_time": now
             },
             # Trade with no mistakes
             {
                 "user_id": "1", 
                 "mistake": "No Mistake",
-                "close_time": datetime.utcnow()
+                "close_time": now
             }
         ]
         
@@ -43,11 +44,15 @@ class MockDB:
                 "user_id": "1"
             }
         ]
+        
+        # Data is static, so filter and index it once instead of on every call
+        self.trades_with_mistake = [t for t in self.trade_data if t.get("mistake") and t.get("mistake") != "No Mistake"]
+        self.mistakes_by_name = {m["name"]: m for m in self.mistake_data}
 
     def find(self, query):
         if "mistake" in query and "$ne" in query["mistake"]:
             # Logic for filtering trades with mistakes
-            return [t for t in self.trade_data if t.get("mistake") and t.get("mistake") != "No Mistake"]
+            return self.trades_with_mistake
             
         if query.get("user_id"):
             # Return list based on collection context (inferred from call)
@@ -57,34 +62,31 @@ class MockDB:
         return [] 
         
     def find_one(self, query):
-        name = query.get("name")
-        for m in self.mistake_data:
-            if m["name"] == name:
-                return m
-        return None
+        return self.mistakes_by_name.get(query.get("name"))
 
 # Override find for specific calls simulation
 class MockCollection:
     def __init__(self, data):
         self.data = data
+        # First document wins, matching the linear scan this replaces
+        self.by_name = {}
+        for d in data:
+            self.by_name.setdefault(d.get("name"), d)
         
     def find(self, query):
         return self.data
         
     def find_one(self, query):
-        name = query.get("name")
-        for d in self.data:
-            if d.get("name") == name:
-                return d
-        return None
+        return self.by_name.get(query.get("name"))
 
 # Better Mock DB
 class BetterMockDB:
     def __init__(self):
+        now = datetime.utcnow()
         self.trades_data = [
-            {"user_id": "1", "mistake": "Overtrading, FOMO Entry", "close_time": datetime.utcnow()},
-            {"user_id": "1", "mistake": "Revenge Trading", "close_time": datetime.utcnow()},
-            {"user_id": "1", "mistake": "No Mistake", "close_time": datetime.utcnow()}
+            {"user_id": "1", "mistake": "Overtrading, FOMO Entry", "close_time": now},
+            {"user_id": "1", "mistake": "Revenge Trading", "close_time": now},
+            {"user_id": "1", "mistake": "No Mistake", "close_time": now}
         ]
         self.mistakes_data = [
             {"_id": "custom1", "name": "Overtrading", "category": "Psychological", "severity": "High", "impact": "Critical", "user_id": "1", "created_at": None}
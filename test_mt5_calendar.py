@@ -3,7 +3,9 @@ from datetime import datetime, timedelta
 import sys
 
 def test_calendar():
-    if not mt5.initialize():
+    # Reuse a terminal that is already attached instead of paying initialize() again
+    owns_terminal = mt5.terminal_info() is None
+    if owns_terminal and not mt5.initialize():
         print("initialize() failed, error code =", mt5.last_error())
         return
 
@@ -13,7 +15,8 @@ def test_calendar():
     if not hasattr(mt5, 'calendar_value_history'):
         print("ERROR: mt5.calendar_value_history function NOT found.")
         print("Available functions:", dir(mt5))
-        mt5.shutdown()
+        if owns_terminal:
+            mt5.shutdown()
         return
 
     # Get events for the last 2 days and next 2 days
@@ -46,7 +49,9 @@ def test_calendar():
     except Exception as e:
         print(f"Error calling calendar_events: {e}")
 
-    mt5.shutdown()
+    # Only tear down a connection this script opened
+    if owns_terminal:
+        mt5.shutdown()
 
 if __name__ == "__main__":
     test_calendar()
@@ -16,36 +16,46 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# unique_id starts with 'ff_' expressed as a plain string range ('`' sorts right after '_')
+FF_PREFIX_FILTER = {"unique_id": {"$gte": "ff_", "$lt": "ff`"}}
+
 async def trigger():
     try:
         logger.info("Connecting to DB...")
         db = get_db()
         logger.info(f"Connected to DB: {db.name}")
         
-        # Test fetch directly
+        # Test fetch directly, off the loop so it overlaps with auto_update_calendar
         from app.services.fair_economy_service import fetch_fair_economy_events
         logger.info("Testing fetch_fair_economy_events directly...")
-        events = fetch_fair_economy_events()
+        logger.info("Triggering auto_update_calendar...")
+        events, _ = await asyncio.gather(
+            asyncio.to_thread(fetch_fair_economy_events),
+            economic_calendar_service.auto_update_calendar(db)
+        )
         logger.info(f"Direct fetch found {len(events)} events.")
         
         if events:
             logger.info(f"First event: {events[0]}")
         
-        logger.info("Triggering auto_update_calendar...")
-        await economic_calendar_service.auto_update_calendar(db)
         logger.info("Update triggered.")
         
-        # Check count
-        count = db.economic_events.count_documents({})
+        # Total, FairEconomy ('ff_' unique_id) count and latest events in one round-trip
+        stats = next(db.economic_events.aggregate([
+            {"$facet": {
+                "total": [{"$count": "c"}],
+                "ff": [{"$match": FF_PREFIX_FILTER}, {"$count": "c"}],
+                "recent": [{"$sort": {"created_at": -1}}, {"$limit": 5}]
+            }}
+        ]))
+        count = stats["total"][0]["c"] if stats["total"] else 0
         logger.info(f"Total events in DB: {count}")
         
-        # Check if any new events with unique_id starting with 'ff_'
-        ff_count = db.economic_events.count_documents({"unique_id": {"$regex": "^ff_"}})
+        ff_count = stats["ff"][0]["c"] if stats["ff"] else 0
         logger.info(f"FairEconomy events in DB: {ff_count}")
         
         # Check a few events
-        events = list(db.economic_events.find().sort("created_at", -1).limit(5))
-        for e in events:
+        for e in stats["recent"]:
             logger.info(f"Event: {e.get('event_name')} ({e.get('event_date')}) ID: {e.get('unique_id')}")
     
     except Exception as e:
@@ -54,5 +64,4 @@ async def trigger():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(trigger())
+    asyncio.run(trigger())
@@ -1,10 +1,15 @@
-import requests
+from app.config import FINNHUB_API_KEY
+from app.http_session import get_session
 
-API_KEY = "d0sa91pr01qkkplu0drgd0sa91pr01qkkplu0ds0"
+API_KEY = FINNHUB_API_KEY
 SYMBOL = "AAPL"
 URL = f"https://finnhub.io/api/v1/quote"
 
 def verify_key():
+    if not API_KEY:
+        print("FINNHUB_API_KEY not set")
+        return
+    
     params = {
         "symbol": SYMBOL,
         "token": API_KEY
@@ -12,7 +17,7 @@ def verify_key():
     
     print(f"Verifying API key with quote for {SYMBOL}...")
     try:
-        response = requests.get(URL, params=params)
+        response = get_session().get(URL, params=params, timeout=15)
         print(f"Status Code: {response.status_code}")
         print("Response:", response.json())
         
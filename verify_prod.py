@@ -1,15 +1,28 @@
-import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
+from app.http_session import get_session, DEFAULT_TIMEOUT
 
 base_url = "https://journal-x-backend.vercel.app"
 
-def check_endpoint(path):
+# Every probe hits the same host, so share one keep-alive session
+SESSION = get_session()
+
+def fetch(path, method="GET"):
     url = f"{base_url}{path}"
+    try:
+        return url, SESSION.request(method, url, allow_redirects=True, timeout=DEFAULT_TIMEOUT), None
+    except Exception as e:
+        return url, None, e
+
+def check_endpoint(url, response, error):
     print(f"Checking {url}...")
+    if error is not None:
+        print(f"Error: {error}")
+        return None
     try:
-        response = requests.get(url)
         print(f"Status: {response.status_code}")
-        if response.status_code == 200:
+        # HEAD probes only care about the status, there is no body to inspect
+        if response.status_code == 200 and response.request.method != "HEAD":
             data = response.json()
             if "version" in data:
                 print(f"Version: {data['version']}")
@@ -22,8 +35,14 @@ def check_endpoint(path):
         print(f"Error: {e}")
     return None
 
-print("--- HEALTH CHECK ---")
-check_endpoint("/health")
+# The probes are independent, so fire them together and report in order
+# /debug/routes still needs GET so its route list can be inspected
+checks = [("HEALTH CHECK", "/health", "HEAD"), ("ROUTES CHECK", "/debug/routes", "GET")]
+with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+    results = list(executor.map(lambda check: fetch(check[1], method=check[2]), checks))
 
-print("\n--- ROUTES CHECK ---")
-check_endpoint("/debug/routes")
+for i, ((label, _, _), result) in enumerate(zip(checks, results)):
+    if i:
+        print()
+    print(f"--- {label} ---")
+    check_endpoint(*result)